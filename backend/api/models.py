@@ -66,7 +66,7 @@ class TrackGeometry(BaseModel):
     def from_domain(cls, geometry: "TrackGeometryData") -> "TrackGeometry":
         return cls(
             track_id=geometry.track_id,
-            coordinates=[list(coord) for coord in geometry.coordinates],
+            coordinates=geometry.coordinates,
             segment_speeds=geometry.segment_speeds,
         )
 
@@ -1,9 +1,9 @@
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import List, Optional
 
 
 @dataclass
 class TrackGeometryData:
     track_id: int
-    coordinates: List[Tuple[float, float]]
+    coordinates: List[List[float]]
     segment_speeds: Optional[List[float]] = field(default=None)
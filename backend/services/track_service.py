@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, List, Tuple, cast
+from typing import Any, Dict, Optional, List, cast
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, update
 from sqlalchemy.engine import CursorResult
@@ -143,12 +143,9 @@ class TrackService:
         if not track or not track.coordinates:
             return None
 
-        coordinates: List[Tuple[float, float]] = [
-            cast(Tuple[float, float], tuple(coord)) for coord in track.coordinates
-        ]
         return TrackGeometryData(
             track_id=track_id,
-            coordinates=coordinates,
+            coordinates=track.coordinates,
             segment_speeds=track.segment_speeds,
         )
 
@@ -170,14 +167,10 @@ class TrackService:
         geometries = []
         for track_model in track_models:
             if track_model.coordinates:
-                coordinates: List[Tuple[float, float]] = [
-                    cast(Tuple[float, float], tuple(coord))
-                    for coord in track_model.coordinates
-                ]
                 geometries.append(
                     TrackGeometryData(
                         track_id=track_model.id,
-                        coordinates=coordinates,
+                        coordinates=track_model.coordinates,
                         segment_speeds=track_model.segment_speeds,
                     )
                 )
@@ -1,26 +1,49 @@
+import copy
+import hashlib
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 import pytest
 import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from passlib.context import CryptContext
 from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import StaticPool
 
 from backend.database import Base
 from backend.main import app
+from backend.api.map_routes import get_storage, get_track_service
 from backend.auth.database import get_async_session
+from backend.models.gpx_data import ParsedGPXData
+from backend.services.gpx_parser import GPXParser
+from backend.services.storage_service import StorageService
+from backend.services.track_service import TrackService
+
+# Minimum bcrypt cost: the login route reads the rounds back from the hash
+pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4, deprecated="auto")
 
 
 async def create_test_user(session: AsyncSession, user_id: str) -> None:
+    await create_test_users(session, [user_id])
+
+
+async def create_test_users(session: AsyncSession, user_ids: list[str]) -> None:
+    """Insert all users in a single executemany round-trip."""
     await session.execute(
         text(
             "INSERT OR IGNORE INTO users (id, email, hashed_password, is_active, is_superuser, is_verified)"
             " VALUES (:id, :email, :hashed_password, 1, 0, 0)"
         ),
-        {
-            "id": user_id,
-            "email": f"{user_id}@test.com",
-            "hashed_password": "not-a-real-hash",
-        },
+        [
+            {
+                "id": user_id,
+                "email": f"{user_id}@test.com",
+                "hashed_password": "not-a-real-hash",
+            }
+            for user_id in user_ids
+        ],
     )
     await session.flush()
 
@@ -28,18 +51,22 @@ async def create_test_user(session: AsyncSession, user_id: str) -> None:
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+SAMPLE_GPX_DIR = project_root / "sample-gpx-files"
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
-@pytest_asyncio.fixture
-async def test_db_session():
-    """Create a fresh in-memory database for each test.
 
-    Uses FastAPI's dependency_overrides to inject test database into app.
-    Each test gets its own isolated in-memory database - no cleanup needed.
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def test_engine():
+    """Create the in-memory test database and its schema once per session.
+
+    StaticPool keeps every session on the same in-memory connection, so the
+    schema survives across tests and the DDL only runs once. Each pytest-xdist
+    worker is a separate process, so every worker gets its own database.
     """
-    # Create in-memory database (fast, isolated, automatically cleaned up)
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
 
     @event.listens_for(engine.sync_engine, "connect")
@@ -47,13 +74,40 @@ async def test_db_session():
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs nest inside the
+        # per-test transaction instead of committing on release
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin_transaction(conn):
+        conn.exec_driver_sql("BEGIN")
 
-    # Create all tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    # Create session maker for this test database
-    test_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def test_db_session(test_engine, monkeypatch):
+    """Provide a session inside a transaction that is rolled back after the test.
+
+    Uses FastAPI's dependency_overrides to inject test database into app.
+    Every session joins the same outer transaction and turns its commits into
+    SAVEPOINT releases, so nothing is ever written for real and the rollback
+    leaves the database clean for the next test.
+    """
+    connection = await test_engine.connect()
+    transaction = await connection.begin()
+
+    # Create session maker bound to the per-test transaction
+    test_session_maker = async_sessionmaker(
+        bind=connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
 
     # Override app's database dependency to use test database
     async def override_get_session():
@@ -64,20 +118,136 @@ async def test_db_session():
                 await session.rollback()
                 raise
 
-    app.dependency_overrides[get_async_session] = override_get_session
+    monkeypatch.setitem(
+        app.dependency_overrides, get_async_session, override_get_session
+    )
 
     # Provide session for direct use in fixtures
     async with test_session_maker() as session:
         yield session
 
-    # Cleanup
-    app.dependency_overrides.clear()
-    await engine.dispose()
+    # Cleanup (monkeypatch removes the dependency override afterwards)
+    await transaction.rollback()
+    await connection.close()
+
+
+@pytest_asyncio.fixture
+async def client(test_db_session):
+    """Async HTTP client for the app, bound to the per-test database."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def gpx_root(tmp_path_factory):
+    """Root for all test GPX storage, on tmpfs (/dev/shm) where available"""
+    shm = Path("/dev/shm")
+    if not shm.is_dir():
+        yield tmp_path_factory.mktemp("gpx")
+        return
+
+    root = Path(tempfile.mkdtemp(prefix="color-the-map-gpx-", dir=shm))
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture(scope="module")
+def module_storage(gpx_root, request):
+    """StorageService over a GPX directory of the test module's own"""
+    return StorageService(gpx_root / request.module.__name__.rpartition(".")[2])
+
+
+@pytest.fixture
+def gpx_storage(module_storage):
+    """The module's StorageService, emptied after each test"""
+    yield module_storage
+    for gpx_file in module_storage.storage_path.iterdir():
+        gpx_file.unlink()
+
+
+@pytest.fixture(scope="module")
+def app_track_service(module_storage, gpx_parser):
+    """Wire a TrackService over the module's storage into the app.
+
+    The services are stateless, so the overrides stay in place for the whole
+    module rather than being rebuilt per test.
+    """
+    track_service = TrackService(module_storage, gpx_parser)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(app.dependency_overrides, get_storage, lambda: module_storage)
+        mp.setitem(app.dependency_overrides, get_track_service, lambda: track_service)
+        yield track_service
+
+
+@pytest.fixture(scope="session")
+def sample_gpx_file():
+    """Sample GPX bytes, read from disk once and shared across the session"""
+    gpx_path = SAMPLE_GPX_DIR / "Cycling 2025-12-19T211415Z.gpx"
+    return gpx_path.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def walking_gpx_file():
+    """Second sample GPX for tests that need two distinct tracks"""
+    gpx_path = SAMPLE_GPX_DIR / "Walking 2031.gpx"
+    return gpx_path.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def gpx_parser():
+    """GPXParser is stateless, so one instance serves the whole session"""
+    return GPXParser()
+
+
+@pytest.fixture(scope="session")
+def parsed_sample_gpx(gpx_parser, sample_gpx_file):
+    """Parsed cycling sample, shared across the session: don't mutate it"""
+    return gpx_parser.parse(sample_gpx_file)
+
+
+# Ten points ~11m and one second apart: enough for distance, speed and elevation
+TINY_GPX = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<gpx version="1.1" creator="color-the-map tests"'
+    b' xmlns="http://www.topografix.com/GPX/1/1"><trk><trkseg>'
+    + b"".join(
+        b'<trkpt lat="%.4f" lon="-122.0000"><ele>%d</ele>'
+        b"<time>2025-01-01T00:00:%02dZ</time></trkpt>" % (47 + i * 0.0001, 100 + i, i)
+        for i in range(10)
+    )
+    + b"</trkseg></trk></gpx>"
+)
+
+
+@pytest.fixture(scope="session")
+def tiny_gpx_file():
+    """Minimal synthetic GPX for tests that only check track metadata"""
+    return TINY_GPX
+
+
+# Parsed results by content digest, kept for the whole session
+_parsed_gpx_cache: dict[bytes, ParsedGPXData] = {}
+
+
+@pytest.fixture(scope="module")
+def cache_parsed_gpx():
+    """Parse each distinct GPX payload only once per test session.
+
+    Opt-in for service and API modules, which upload the same sample files
+    dozens of times; the parser's own tests keep the real GPXParser.parse.
+    Results are keyed by a digest of the content and handed out as deep copies
+    so that no test can mutate another test's parsed data.
+    """
+    original_parse = GPXParser.parse
 
+    def parse(self: GPXParser, content: bytes) -> ParsedGPXData:
+        key = hashlib.blake2b(content, digest_size=16).digest()
+        if key not in _parsed_gpx_cache:
+            _parsed_gpx_cache[key] = original_parse(self, content)
+        return copy.deepcopy(_parsed_gpx_cache[key])
 
-@pytest.fixture(scope="function")
-def test_gpx_dir(tmp_path):
-    """Create a temporary GPX directory for each test"""
-    gpx_dir = tmp_path / "gpx"
-    gpx_dir.mkdir()
-    return gpx_dir
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(GPXParser, "parse", parse)
+        yield
@@ -1,34 +1,16 @@
 import pytest
 import pytest_asyncio
-from pathlib import Path
 from fastapi.testclient import TestClient
 from backend.main import app
 from backend.auth.models import User
 from backend.services.map_service import MapService
-from passlib.context import CryptContext
 import uuid
+from .conftest import pwd_context
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-
-@pytest.fixture(scope="function", autouse=True)
-def setup_api_test_environment(test_gpx_dir):
-    from backend.services.storage_service import StorageService
-    from backend.services.gpx_parser import GPXParser
-    from backend.services.track_service import TrackService
-    from backend.api.map_routes import get_storage, get_track_service
-
-    new_storage = StorageService(test_gpx_dir)
-    new_parser = GPXParser()
-    new_track_service = TrackService(new_storage, new_parser)
-
-    app.dependency_overrides[get_storage] = lambda: new_storage
-    app.dependency_overrides[get_track_service] = lambda: new_track_service
-
-    yield
-
-    app.dependency_overrides.pop(get_storage, None)
-    app.dependency_overrides.pop(get_track_service, None)
+pytestmark = pytest.mark.usefixtures(
+    "cache_parsed_gpx", "app_track_service", "gpx_storage"
+)
 
 
 client = TestClient(app)
@@ -62,13 +44,14 @@ async def user_with_map(test_db_session):
 
 
 @pytest.fixture
-def sample_gpx_file():
-    test_dir = Path(__file__).parent
-    gpx_path = (
-        test_dir / ".." / ".." / "sample-gpx-files" / "Cycling 2025-12-19T211415Z.gpx"
+def uploaded_track(user_with_map, sample_gpx_file):
+    """Upload the sample GPX as the test user and add its track_id."""
+    response = client.post(
+        f"/api/v1/maps/{user_with_map['map_id']}/tracks",
+        files=[("files", ("test.gpx", sample_gpx_file, "application/gpx+xml"))],
+        headers={"Authorization": f"Bearer {user_with_map['token']}"},
     )
-    with open(gpx_path, "rb") as f:
-        return f.read()
+    return {**user_with_map, "track_id": response.json()["track_ids"][0]}
 
 
 def test_health_check():
@@ -117,16 +100,10 @@ def test_list_tracks(sample_gpx_file, user_with_map):
     assert "distance_meters" in tracks[0]
 
 
-def test_get_track_geometry(sample_gpx_file, user_with_map):
-    token = user_with_map["token"]
-    map_id = user_with_map["map_id"]
-
-    upload_response = client.post(
-        f"/api/v1/maps/{map_id}/tracks",
-        files=[("files", ("test.gpx", sample_gpx_file, "application/gpx+xml"))],
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    track_id = upload_response.json()["track_ids"][0]
+def test_get_track_geometry(uploaded_track):
+    token = uploaded_track["token"]
+    map_id = uploaded_track["map_id"]
+    track_id = uploaded_track["track_id"]
 
     response = client.post(
         f"/api/v1/maps/{map_id}/tracks/geometry",
@@ -141,16 +118,10 @@ def test_get_track_geometry(sample_gpx_file, user_with_map):
     assert len(geometries[0]["coordinates"]) > 0
 
 
-def test_get_track_geometry_includes_segment_speeds(sample_gpx_file, user_with_map):
-    token = user_with_map["token"]
-    map_id = user_with_map["map_id"]
-
-    upload_response = client.post(
-        f"/api/v1/maps/{map_id}/tracks",
-        files=[("files", ("test.gpx", sample_gpx_file, "application/gpx+xml"))],
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    track_id = upload_response.json()["track_ids"][0]
+def test_get_track_geometry_includes_segment_speeds(uploaded_track):
+    token = uploaded_track["token"]
+    map_id = uploaded_track["map_id"]
+    track_id = uploaded_track["track_id"]
 
     response = client.post(
         f"/api/v1/maps/{map_id}/tracks/geometry",
@@ -166,16 +137,10 @@ def test_get_track_geometry_includes_segment_speeds(sample_gpx_file, user_with_m
     assert len(geometries[0]["segment_speeds"]) == len(geometries[0]["coordinates"]) - 1
 
 
-def test_update_track(sample_gpx_file, user_with_map):
-    token = user_with_map["token"]
-    map_id = user_with_map["map_id"]
-
-    upload_response = client.post(
-        f"/api/v1/maps/{map_id}/tracks",
-        files=[("files", ("test.gpx", sample_gpx_file, "application/gpx+xml"))],
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    track_id = upload_response.json()["track_ids"][0]
+def test_update_track(uploaded_track):
+    token = uploaded_track["token"]
+    map_id = uploaded_track["map_id"]
+    track_id = uploaded_track["track_id"]
 
     response = client.patch(
         f"/api/v1/maps/{map_id}/tracks/{track_id}",
@@ -201,16 +166,10 @@ def test_update_nonexistent_track(user_with_map):
     assert response.status_code == 404
 
 
-def test_delete_single_track(sample_gpx_file, user_with_map):
-    token = user_with_map["token"]
-    map_id = user_with_map["map_id"]
-
-    upload_response = client.post(
-        f"/api/v1/maps/{map_id}/tracks",
-        files=[("files", ("test.gpx", sample_gpx_file, "application/gpx+xml"))],
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    track_id = upload_response.json()["track_ids"][0]
+def test_delete_single_track(uploaded_track):
+    token = uploaded_track["token"]
+    map_id = uploaded_track["map_id"]
+    track_id = uploaded_track["track_id"]
 
     response = client.request(
         "DELETE",
@@ -231,26 +190,15 @@ def test_delete_single_track(sample_gpx_file, user_with_map):
     assert not any(t["id"] == track_id for t in tracks)
 
 
-def test_delete_multiple_tracks(user_with_map):
+def test_delete_multiple_tracks(sample_gpx_file, walking_gpx_file, user_with_map):
     token = user_with_map["token"]
     map_id = user_with_map["map_id"]
 
-    test_dir = Path(__file__).parent
-    gpx1_path = (
-        test_dir / ".." / ".." / "sample-gpx-files" / "Cycling 2025-12-19T211415Z.gpx"
-    )
-    gpx2_path = test_dir / ".." / ".." / "sample-gpx-files" / "Walking 2031.gpx"
-
-    with open(gpx1_path, "rb") as f:
-        content1 = f.read()
-    with open(gpx2_path, "rb") as f:
-        content2 = f.read()
-
     upload_response = client.post(
         f"/api/v1/maps/{map_id}/tracks",
         files=[
-            ("files", ("test1.gpx", content1, "application/gpx+xml")),
-            ("files", ("test2.gpx", content2, "application/gpx+xml")),
+            ("files", ("test1.gpx", sample_gpx_file, "application/gpx+xml")),
+            ("files", ("test2.gpx", walking_gpx_file, "application/gpx+xml")),
         ],
         headers={"Authorization": f"Bearer {token}"},
     )
@@ -284,16 +232,10 @@ def test_delete_nonexistent_track(user_with_map):
     assert data["deleted"] == 0
 
 
-def test_delete_with_mixed_ids(sample_gpx_file, user_with_map):
-    token = user_with_map["token"]
-    map_id = user_with_map["map_id"]
-
-    upload_response = client.post(
-        f"/api/v1/maps/{map_id}/tracks",
-        files=[("files", ("test.gpx", sample_gpx_file, "application/gpx+xml"))],
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    existing_id = upload_response.json()["track_ids"][0]
+def test_delete_with_mixed_ids(uploaded_track):
+    token = uploaded_track["token"]
+    map_id = uploaded_track["map_id"]
+    existing_id = uploaded_track["track_id"]
 
     response = client.request(
         "DELETE",
@@ -307,26 +249,15 @@ def test_delete_with_mixed_ids(sample_gpx_file, user_with_map):
     assert data["deleted"] == 1
 
 
-def test_bulk_update_tracks(user_with_map):
+def test_bulk_update_tracks(sample_gpx_file, walking_gpx_file, user_with_map):
     token = user_with_map["token"]
     map_id = user_with_map["map_id"]
 
-    test_dir = Path(__file__).parent
-    gpx1_path = (
-        test_dir / ".." / ".." / "sample-gpx-files" / "Cycling 2025-12-19T211415Z.gpx"
-    )
-    gpx2_path = test_dir / ".." / ".." / "sample-gpx-files" / "Walking 2031.gpx"
-
-    with open(gpx1_path, "rb") as f:
-        content1 = f.read()
-    with open(gpx2_path, "rb") as f:
-        content2 = f.read()
-
     upload_response = client.post(
         f"/api/v1/maps/{map_id}/tracks",
         files=[
-            ("files", ("test1.gpx", content1, "application/gpx+xml")),
-            ("files", ("test2.gpx", content2, "application/gpx+xml")),
+            ("files", ("test1.gpx", sample_gpx_file, "application/gpx+xml")),
+            ("files", ("test2.gpx", walking_gpx_file, "application/gpx+xml")),
         ],
         headers={"Authorization": f"Bearer {token}"},
     )
@@ -382,16 +313,10 @@ def test_bulk_update_tracks_nonexistent(user_with_map):
     assert data["updated"] == 0
 
 
-def test_bulk_update_tracks_mixed_ids(sample_gpx_file, user_with_map):
-    token = user_with_map["token"]
-    map_id = user_with_map["map_id"]
-
-    upload_response = client.post(
-        f"/api/v1/maps/{map_id}/tracks",
-        files=[("files", ("test.gpx", sample_gpx_file, "application/gpx+xml"))],
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    existing_id = upload_response.json()["track_ids"][0]
+def test_bulk_update_tracks_mixed_ids(uploaded_track):
+    token = uploaded_track["token"]
+    map_id = uploaded_track["map_id"]
+    existing_id = uploaded_track["track_id"]
 
     response = client.patch(
         f"/api/v1/maps/{map_id}/tracks/bulk",
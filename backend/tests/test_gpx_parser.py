@@ -1,25 +1,10 @@
 import pytest
-from pathlib import Path
 from backend.services.gpx_parser import GPXParser
+from .conftest import FIXTURES_DIR, SAMPLE_GPX_DIR
 
 
-@pytest.fixture
-def parser():
-    return GPXParser()
-
-
-@pytest.fixture
-def sample_gpx_content():
-    test_dir = Path(__file__).parent
-    gpx_path = (
-        test_dir / ".." / ".." / "sample-gpx-files" / "Cycling 2025-12-19T211415Z.gpx"
-    )
-    with open(gpx_path, "rb") as f:
-        return f.read()
-
-
-def test_parse_basic_gpx(parser, sample_gpx_content):
-    result = parser.parse(sample_gpx_content)
+def test_parse_basic_gpx(gpx_parser, sample_gpx_file):
+    result = gpx_parser.parse(sample_gpx_file)
 
     assert result.distance_meters > 0
     assert len(result.coordinates) > 0
@@ -28,8 +13,8 @@ def test_parse_basic_gpx(parser, sample_gpx_content):
     assert result.activity_date is not None
 
 
-def test_coordinates_format(parser, sample_gpx_content):
-    result = parser.parse(sample_gpx_content)
+def test_coordinates_format(gpx_parser, sample_gpx_file):
+    result = gpx_parser.parse(sample_gpx_file)
 
     coords = result.coordinates
     assert isinstance(coords, list)
@@ -42,23 +27,23 @@ def test_coordinates_format(parser, sample_gpx_content):
     assert isinstance(first_coord[1], float)
 
 
-def test_distance_calculation(parser, sample_gpx_content):
-    result = parser.parse(sample_gpx_content)
+def test_distance_calculation(gpx_parser, sample_gpx_file):
+    result = gpx_parser.parse(sample_gpx_file)
 
     distance = result.distance_meters
     assert distance > 0
     assert distance < 1000000
 
 
-def test_elevation_statistics(parser, sample_gpx_content):
-    result = parser.parse(sample_gpx_content)
+def test_elevation_statistics(gpx_parser, sample_gpx_file):
+    result = gpx_parser.parse(sample_gpx_file)
 
     assert result.elevation_gain_meters >= 0
     assert result.elevation_loss_meters >= 0
 
 
-def test_bounds_calculation(parser, sample_gpx_content):
-    result = parser.parse(sample_gpx_content)
+def test_bounds_calculation(gpx_parser, sample_gpx_file):
+    result = gpx_parser.parse(sample_gpx_file)
 
     assert result.bounds_min_lat < result.bounds_max_lat
     assert result.bounds_min_lon < result.bounds_max_lon
@@ -66,50 +51,35 @@ def test_bounds_calculation(parser, sample_gpx_content):
     assert -180 <= result.bounds_min_lon <= 180
 
 
-def test_invalid_gpx(parser):
+def test_invalid_gpx(gpx_parser):
     with pytest.raises(Exception):
-        parser.parse(b"<invalid>not a gpx file</invalid>")
+        gpx_parser.parse(b"<invalid>not a gpx file</invalid>")
 
 
-def test_empty_gpx(parser):
+def test_empty_gpx(gpx_parser):
     gpx_content = (
         b'<?xml version="1.0"?><gpx version="1.1"><trk><trkseg></trkseg></trk></gpx>'
     )
     with pytest.raises(ValueError, match="No track points"):
-        parser.parse(gpx_content)
-
+        gpx_parser.parse(gpx_content)
 
-def test_parses_creator_from_gpx_export(parser):
-    test_dir = Path(__file__).parent
-    gpx_path = (
-        test_dir / ".." / ".." / "sample-gpx-files" / "Cycling 2025-12-19T211415Z.gpx"
-    )
-    with open(gpx_path, "rb") as f:
-        content = f.read()
 
-    result = parser.parse(content)
+def test_parses_creator_from_gpx_export(gpx_parser, sample_gpx_file):
+    result = gpx_parser.parse(sample_gpx_file)
     assert result.creator == "GPX Export"
 
 
-def test_parses_creator_from_apple_health(parser):
-    test_dir = Path(__file__).parent
-    gpx_path = (
-        test_dir / ".." / ".." / "sample-gpx-files" / "route_2024-09-21_9.04am.gpx"
-    )
-    with open(gpx_path, "rb") as f:
-        content = f.read()
+def test_parses_creator_from_apple_health(gpx_parser):
+    content = (SAMPLE_GPX_DIR / "route_2024-09-21_9.04am.gpx").read_bytes()
 
-    result = parser.parse(content)
+    result = gpx_parser.parse(content)
     assert result.creator == "Apple Health Export"
 
 
-def test_creator_is_none_when_missing(parser):
-    test_dir = Path(__file__).parent
-    gpx_path = test_dir / "fixtures" / "test-no-creator.gpx"
-    with open(gpx_path, "rb") as f:
-        content = f.read()
+def test_creator_is_none_when_missing(gpx_parser):
+    content = (FIXTURES_DIR / "test-no-creator.gpx").read_bytes()
 
-    result = parser.parse(content)
+    result = gpx_parser.parse(content)
     assert result.creator is None
 
 
@@ -186,8 +156,8 @@ def test_infer_activity_type_position_independent():
     assert GPXParser.infer_activity_type("my-bike-ride-2025.gpx") == "Cycling"
 
 
-def test_speed_statistics_vary(parser, sample_gpx_content):
-    result = parser.parse(sample_gpx_content)
+def test_speed_statistics_vary(gpx_parser, sample_gpx_file):
+    result = gpx_parser.parse(sample_gpx_file)
 
     assert result.avg_speed_ms >= 0
     assert result.max_speed_ms >= result.avg_speed_ms
@@ -195,14 +165,14 @@ def test_speed_statistics_vary(parser, sample_gpx_content):
     assert result.min_speed_ms >= 0
 
 
-def test_speed_stats_not_all_identical(parser, sample_gpx_content):
-    result = parser.parse(sample_gpx_content)
+def test_speed_stats_not_all_identical(gpx_parser, sample_gpx_file):
+    result = gpx_parser.parse(sample_gpx_file)
 
     speeds = [result.avg_speed_ms, result.max_speed_ms, result.min_speed_ms]
     assert len(set(speeds)) > 1, "min, max, and avg speeds should not all be identical"
 
 
-def test_speed_calculation_with_no_timestamps(parser):
+def test_speed_calculation_with_no_timestamps(gpx_parser):
     gpx_content = b"""<?xml version="1.0"?>
     <gpx version="1.1">
         <trk><trkseg>
@@ -210,14 +180,14 @@ def test_speed_calculation_with_no_timestamps(parser):
             <trkpt lat="35.001" lon="-79.001"></trkpt>
         </trkseg></trk>
     </gpx>"""
-    result = parser.parse(gpx_content)
+    result = gpx_parser.parse(gpx_content)
 
     assert result.avg_speed_ms == 0.0
     assert result.max_speed_ms == 0.0
     assert result.min_speed_ms == 0.0
 
 
-def test_speed_calculation_with_single_point(parser):
+def test_speed_calculation_with_single_point(gpx_parser):
     gpx_content = b"""<?xml version="1.0"?>
     <gpx version="1.1">
         <trk><trkseg>
@@ -226,14 +196,14 @@ def test_speed_calculation_with_single_point(parser):
             </trkpt>
         </trkseg></trk>
     </gpx>"""
-    result = parser.parse(gpx_content)
+    result = gpx_parser.parse(gpx_content)
 
     assert result.avg_speed_ms == 0.0
     assert result.max_speed_ms == 0.0
     assert result.min_speed_ms == 0.0
 
 
-def test_speed_calculation_with_varying_speeds(parser):
+def test_speed_calculation_with_varying_speeds(gpx_parser):
     gpx_content = b"""<?xml version="1.0"?>
     <gpx version="1.1">
         <trk><trkseg>
@@ -242,21 +212,21 @@ def test_speed_calculation_with_varying_speeds(parser):
             <trkpt lat="35.002" lon="-79.0"><time>2025-01-01T10:00:30Z</time></trkpt>
         </trkseg></trk>
     </gpx>"""
-    result = parser.parse(gpx_content)
+    result = gpx_parser.parse(gpx_content)
 
     assert result.max_speed_ms > result.min_speed_ms
     assert result.min_speed_ms <= result.avg_speed_ms <= result.max_speed_ms
 
 
-def test_segment_speeds_returned_for_multi_point_track(parser, sample_gpx_content):
-    result = parser.parse(sample_gpx_content)
+def test_segment_speeds_returned_for_multi_point_track(gpx_parser, sample_gpx_file):
+    result = gpx_parser.parse(sample_gpx_file)
 
     assert result.segment_speeds is not None
     assert len(result.segment_speeds) == len(result.coordinates) - 1
     assert all(speed >= 0 for speed in result.segment_speeds)
 
 
-def test_segment_speeds_empty_without_timestamps(parser):
+def test_segment_speeds_empty_without_timestamps(gpx_parser):
     gpx_content = b"""<?xml version="1.0"?>
     <gpx version="1.1">
         <trk><trkseg>
@@ -264,12 +234,12 @@ def test_segment_speeds_empty_without_timestamps(parser):
             <trkpt lat="35.001" lon="-79.001"></trkpt>
         </trkseg></trk>
     </gpx>"""
-    result = parser.parse(gpx_content)
+    result = gpx_parser.parse(gpx_content)
 
     assert result.segment_speeds == []
 
 
-def test_segment_speeds_match_speed_stats(parser):
+def test_segment_speeds_match_speed_stats(gpx_parser):
     gpx_content = b"""<?xml version="1.0"?>
     <gpx version="1.1">
         <trk><trkseg>
@@ -278,7 +248,7 @@ def test_segment_speeds_match_speed_stats(parser):
             <trkpt lat="35.002" lon="-79.0"><time>2025-01-01T10:00:30Z</time></trkpt>
         </trkseg></trk>
     </gpx>"""
-    result = parser.parse(gpx_content)
+    result = gpx_parser.parse(gpx_content)
 
     assert len(result.segment_speeds) == 2
     assert max(result.segment_speeds) == pytest.approx(result.max_speed_ms)
@@ -1,34 +1,16 @@
 import pytest
 import pytest_asyncio
-from pathlib import Path
 from fastapi.testclient import TestClient
 from backend.main import app
 from backend.auth.models import User
 from backend.services.map_service import MapService
-from passlib.context import CryptContext
 import uuid
+from .conftest import pwd_context
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-
-@pytest.fixture(scope="function", autouse=True)
-def setup_api_test_environment(test_gpx_dir):
-    from backend.services.storage_service import StorageService
-    from backend.services.gpx_parser import GPXParser
-    from backend.services.track_service import TrackService
-    from backend.api.map_routes import get_storage, get_track_service
-
-    new_storage = StorageService(test_gpx_dir)
-    new_parser = GPXParser()
-    new_track_service = TrackService(new_storage, new_parser)
-
-    app.dependency_overrides[get_storage] = lambda: new_storage
-    app.dependency_overrides[get_track_service] = lambda: new_track_service
-
-    yield
-
-    app.dependency_overrides.pop(get_storage, None)
-    app.dependency_overrides.pop(get_track_service, None)
+pytestmark = pytest.mark.usefixtures(
+    "cache_parsed_gpx", "app_track_service", "gpx_storage"
+)
 
 
 client = TestClient(app)
@@ -81,16 +63,6 @@ async def user_with_default_map(test_db_session):
     return {"token": token, "user_id": user_id, "map_id": default_map.id}
 
 
-@pytest.fixture
-def sample_gpx_file():
-    test_dir = Path(__file__).parent
-    gpx_path = (
-        test_dir / ".." / ".." / "sample-gpx-files" / "Cycling 2025-12-19T211415Z.gpx"
-    )
-    with open(gpx_path, "rb") as f:
-        return f.read()
-
-
 def test_create_map(auth_token):
     response = client.post(
         "/api/v1/maps",
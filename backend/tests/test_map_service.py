@@ -17,7 +17,6 @@ OTHER_USER_ID = "other-user-456"
 async def setup_users(test_db_session):
     await create_test_user(test_db_session, USER_ID)
     await create_test_user(test_db_session, OTHER_USER_ID)
-    await test_db_session.commit()
 
 
 @pytest.mark.asyncio
@@ -32,7 +31,6 @@ async def test_create_map(map_service, test_db_session):
 @pytest.mark.asyncio
 async def test_get_map(map_service, test_db_session):
     created = await map_service.create_map("My Map", USER_ID, test_db_session)
-    await test_db_session.commit()
 
     fetched = await map_service.get_map(created.id, USER_ID, test_db_session)
     assert fetched is not None
@@ -43,7 +41,6 @@ async def test_get_map(map_service, test_db_session):
 @pytest.mark.asyncio
 async def test_get_map_wrong_user(map_service, test_db_session):
     created = await map_service.create_map("My Map", USER_ID, test_db_session)
-    await test_db_session.commit()
 
     fetched = await map_service.get_map(created.id, OTHER_USER_ID, test_db_session)
     assert fetched is None
@@ -54,7 +51,6 @@ async def test_list_maps_ordered_by_name(map_service, test_db_session):
     await map_service.create_map("Zebra Map", USER_ID, test_db_session)
     await map_service.create_map("Alpha Map", USER_ID, test_db_session)
     await map_service.create_map("Beta Map", USER_ID, test_db_session)
-    await test_db_session.commit()
 
     maps = await map_service.list_maps(USER_ID, test_db_session)
     assert len(maps) == 3
@@ -67,7 +63,6 @@ async def test_list_maps_ordered_by_name(map_service, test_db_session):
 async def test_list_maps_user_isolation(map_service, test_db_session):
     await map_service.create_map("User 1 Map", USER_ID, test_db_session)
     await map_service.create_map("User 2 Map", OTHER_USER_ID, test_db_session)
-    await test_db_session.commit()
 
     maps = await map_service.list_maps(USER_ID, test_db_session)
     assert len(maps) == 1
@@ -77,7 +72,6 @@ async def test_list_maps_user_isolation(map_service, test_db_session):
 @pytest.mark.asyncio
 async def test_update_map_name(map_service, test_db_session):
     created = await map_service.create_map("Original", USER_ID, test_db_session)
-    await test_db_session.commit()
 
     updated = await map_service.update_map(
         created.id, {"name": "Renamed"}, USER_ID, test_db_session
@@ -89,7 +83,6 @@ async def test_update_map_name(map_service, test_db_session):
 @pytest.mark.asyncio
 async def test_update_map_wrong_user(map_service, test_db_session):
     created = await map_service.create_map("My Map", USER_ID, test_db_session)
-    await test_db_session.commit()
 
     updated = await map_service.update_map(
         created.id, {"name": "Hacked"}, OTHER_USER_ID, test_db_session
@@ -101,7 +94,6 @@ async def test_update_map_wrong_user(map_service, test_db_session):
 async def test_delete_map(map_service, test_db_session):
     map1 = await map_service.create_map("Map 1", USER_ID, test_db_session)
     await map_service.create_map("Map 2", USER_ID, test_db_session)
-    await test_db_session.commit()
 
     result = await map_service.delete_map(map1.id, USER_ID, test_db_session)
     assert result.deleted is True
@@ -113,7 +105,6 @@ async def test_delete_map(map_service, test_db_session):
 @pytest.mark.asyncio
 async def test_cannot_delete_last_map(map_service, test_db_session):
     only_map = await map_service.create_map("Only Map", USER_ID, test_db_session)
-    await test_db_session.commit()
 
     result = await map_service.delete_map(only_map.id, USER_ID, test_db_session)
     assert result.deleted is False
@@ -127,7 +118,6 @@ async def test_cannot_delete_last_map(map_service, test_db_session):
 async def test_delete_map_wrong_user(map_service, test_db_session):
     await map_service.create_map("Map 1", USER_ID, test_db_session)
     map2 = await map_service.create_map("Map 2", USER_ID, test_db_session)
-    await test_db_session.commit()
 
     result = await map_service.delete_map(map2.id, OTHER_USER_ID, test_db_session)
     assert result.deleted is False
@@ -1,10 +1,9 @@
 import pytest
-from backend.services.storage_service import StorageService
 
 
 @pytest.fixture
-def storage(tmp_path):
-    return StorageService(tmp_path)
+def storage(gpx_storage):
+    return gpx_storage
 
 
 def test_calculate_hash(storage):
@@ -1,247 +1,171 @@
 import pytest
 import pytest_asyncio
-from pathlib import Path
-from httpx import ASGITransport, AsyncClient
-from backend.main import app
 from backend.auth.models import User
 from backend.services.map_service import MapService
-from passlib.context import CryptContext
 import uuid
+from .conftest import pwd_context
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-
-@pytest_asyncio.fixture(autouse=True)
-async def setup_services(test_gpx_dir):
-    from backend.services.storage_service import StorageService
-    from backend.services.gpx_parser import GPXParser
-    from backend.services.track_service import TrackService
-    from backend.api.map_routes import get_storage, get_track_service
-
-    new_storage = StorageService(test_gpx_dir)
-    new_parser = GPXParser()
-    new_track_service = TrackService(new_storage, new_parser)
-
-    app.dependency_overrides[get_storage] = lambda: new_storage
-    app.dependency_overrides[get_track_service] = lambda: new_track_service
-
-    yield
-
-    app.dependency_overrides.pop(get_storage, None)
-    app.dependency_overrides.pop(get_track_service, None)
+pytestmark = pytest.mark.usefixtures(
+    "cache_parsed_gpx", "app_track_service", "gpx_storage"
+)
 
 
 @pytest_asyncio.fixture
-async def user1_with_map(test_db_session):
-    user_id = str(uuid.uuid4())
-    user = User(
-        id=user_id,
-        email="user1@example.com",
-        hashed_password=pwd_context.hash("password1"),
-        is_active=True,
-        is_verified=True,
-        is_superuser=False,
-    )
-    test_db_session.add(user)
+async def both_users_with_maps(test_db_session):
+    """Create both users and their default maps with a single commit."""
+    users = [
+        User(
+            id=uuid.uuid4(),
+            email=f"user{n}@example.com",
+            hashed_password=pwd_context.hash(f"password{n}"),
+            is_active=True,
+            is_verified=True,
+            is_superuser=False,
+        )
+        for n in (1, 2)
+    ]
+    test_db_session.add_all(users)
     await test_db_session.flush()
 
     map_service = MapService()
-    default_map = await map_service.create_map("My Map", user_id, test_db_session)
+    users_with_maps = []
+    for user in users:
+        default_map = await map_service.create_map(
+            "My Map", str(user.id), test_db_session
+        )
+        users_with_maps.append({"user": user, "map_id": default_map.id})
     await test_db_session.commit()
 
-    return {"user": user, "map_id": default_map.id}
+    return users_with_maps
 
 
-@pytest_asyncio.fixture
-async def user2_with_map(test_db_session):
-    user_id = str(uuid.uuid4())
-    user = User(
-        id=user_id,
-        email="user2@example.com",
-        hashed_password=pwd_context.hash("password2"),
-        is_active=True,
-        is_verified=True,
-        is_superuser=False,
-    )
-    test_db_session.add(user)
-    await test_db_session.flush()
+@pytest.fixture
+def user1_with_map(both_users_with_maps):
+    return both_users_with_maps[0]
 
-    map_service = MapService()
-    default_map = await map_service.create_map("My Map", user_id, test_db_session)
-    await test_db_session.commit()
 
-    return {"user": user, "map_id": default_map.id}
+@pytest.fixture
+def user2_with_map(both_users_with_maps):
+    return both_users_with_maps[1]
 
 
-@pytest.fixture
-def sample_gpx_file():
-    test_dir = Path(__file__).parent
-    gpx_path = (
-        test_dir / ".." / ".." / "sample-gpx-files" / "Cycling 2025-12-19T211415Z.gpx"
+@pytest_asyncio.fixture
+async def auth_tokens(client, user1_with_map, user2_with_map):
+    """Log both users in once and share their access tokens with the test."""
+    login1 = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "user1@example.com", "password": "password1"},
+    )
+    login2 = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "user2@example.com", "password": "password2"},
     )
-    with open(gpx_path, "rb") as f:
-        return f.read()
+
+    return {
+        "token1": login1.json()["access_token"],
+        "token2": login2.json()["access_token"],
+    }
 
 
 @pytest.mark.asyncio
 async def test_users_see_only_their_own_tracks(
-    user1_with_map, user2_with_map, sample_gpx_file
+    client, user1_with_map, user2_with_map, auth_tokens, sample_gpx_file
 ):
     map1_id = user1_with_map["map_id"]
     map2_id = user2_with_map["map_id"]
+    token1, token2 = auth_tokens["token1"], auth_tokens["token2"]
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        login1 = await client.post(
-            "/api/v1/auth/login",
-            data={"username": "user1@example.com", "password": "password1"},
-        )
-        token1 = login1.json()["access_token"]
-
-        login2 = await client.post(
-            "/api/v1/auth/login",
-            data={"username": "user2@example.com", "password": "password2"},
-        )
-        token2 = login2.json()["access_token"]
-
-        upload1 = await client.post(
-            f"/api/v1/maps/{map1_id}/tracks",
-            files=[
-                ("files", ("user1_track.gpx", sample_gpx_file, "application/gpx+xml"))
-            ],
-            headers={"Authorization": f"Bearer {token1}"},
-        )
-        assert upload1.status_code == 201
+    upload1 = await client.post(
+        f"/api/v1/maps/{map1_id}/tracks",
+        files=[("files", ("user1_track.gpx", sample_gpx_file, "application/gpx+xml"))],
+        headers={"Authorization": f"Bearer {token1}"},
+    )
+    assert upload1.status_code == 201
 
-        tracks1 = await client.get(
-            f"/api/v1/maps/{map1_id}/tracks",
-            headers={"Authorization": f"Bearer {token1}"},
-        )
-        assert tracks1.status_code == 200
-        assert len(tracks1.json()) == 1
+    tracks1 = await client.get(
+        f"/api/v1/maps/{map1_id}/tracks",
+        headers={"Authorization": f"Bearer {token1}"},
+    )
+    assert tracks1.status_code == 200
+    assert len(tracks1.json()) == 1
 
-        tracks2 = await client.get(
-            f"/api/v1/maps/{map2_id}/tracks",
-            headers={"Authorization": f"Bearer {token2}"},
-        )
-        assert tracks2.status_code == 200
-        assert len(tracks2.json()) == 0
+    tracks2 = await client.get(
+        f"/api/v1/maps/{map2_id}/tracks",
+        headers={"Authorization": f"Bearer {token2}"},
+    )
+    assert tracks2.status_code == 200
+    assert len(tracks2.json()) == 0
 
 
-@pytest.mark.asyncio
-async def test_user_cannot_update_other_users_track(
-    user1_with_map, user2_with_map, sample_gpx_file
+@pytest_asyncio.fixture
+async def logged_in_with_track(
+    test_db_session, app_track_service, user1_with_map, auth_tokens, sample_gpx_file
 ):
-    map1_id = user1_with_map["map_id"]
-
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        login1 = await client.post(
-            "/api/v1/auth/login",
-            data={"username": "user1@example.com", "password": "password1"},
-        )
-        token1 = login1.json()["access_token"]
-
-        login2 = await client.post(
-            "/api/v1/auth/login",
-            data={"username": "user2@example.com", "password": "password2"},
-        )
-        token2 = login2.json()["access_token"]
-
-        upload = await client.post(
-            f"/api/v1/maps/{map1_id}/tracks",
-            files=[("files", ("track.gpx", sample_gpx_file, "application/gpx+xml"))],
-            headers={"Authorization": f"Bearer {token1}"},
-        )
-        track_id = upload.json()["track_ids"][0]
-
-        update_response = await client.patch(
-            f"/api/v1/maps/{map1_id}/tracks/{track_id}",
-            json={"name": "Hacked Name"},
-            headers={"Authorization": f"Bearer {token2}"},
-        )
+    """Give user1 one track and return what an attacker test needs.
 
-        assert update_response.status_code == 404
-
-
-@pytest.mark.asyncio
-async def test_user_cannot_delete_other_users_track(
-    user1_with_map, user2_with_map, sample_gpx_file
-):
+    Only the attacker's request is under test, so the track is created through
+    the service directly rather than a multipart upload.
+    """
     map1_id = user1_with_map["map_id"]
+    result = await app_track_service.upload_track(
+        "track.gpx",
+        sample_gpx_file,
+        map1_id,
+        str(user1_with_map["user"].id),
+        test_db_session,
+    )
+    await test_db_session.commit()
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        login1 = await client.post(
-            "/api/v1/auth/login",
-            data={"username": "user1@example.com", "password": "password1"},
-        )
-        token1 = login1.json()["access_token"]
-
-        login2 = await client.post(
-            "/api/v1/auth/login",
-            data={"username": "user2@example.com", "password": "password2"},
-        )
-        token2 = login2.json()["access_token"]
-
-        upload = await client.post(
-            f"/api/v1/maps/{map1_id}/tracks",
-            files=[("files", ("track.gpx", sample_gpx_file, "application/gpx+xml"))],
-            headers={"Authorization": f"Bearer {token1}"},
-        )
-        track_id = upload.json()["track_ids"][0]
-
-        delete_response = await client.request(
-            "DELETE",
-            f"/api/v1/maps/{map1_id}/tracks",
-            json={"track_ids": [track_id]},
-            headers={"Authorization": f"Bearer {token2}"},
-        )
-
-        assert delete_response.status_code == 404
-
-        tracks = await client.get(
-            f"/api/v1/maps/{map1_id}/tracks",
-            headers={"Authorization": f"Bearer {token1}"},
-        )
-        assert len(tracks.json()) == 1
+    return {
+        "token1": auth_tokens["token1"],
+        "token2": auth_tokens["token2"],
+        "map1_id": map1_id,
+        "track_id": result.track.id,
+    }
 
 
 @pytest.mark.asyncio
-async def test_user_cannot_get_other_users_geometry(
-    user1_with_map, user2_with_map, sample_gpx_file
+@pytest.mark.parametrize(
+    "method, path, body",
+    [
+        pytest.param(
+            "PATCH",
+            "/{track_id}",
+            lambda track_id: {"name": "Hacked Name"},
+            id="update",
+        ),
+        pytest.param(
+            "DELETE",
+            "",
+            lambda track_id: {"track_ids": [track_id]},
+            id="delete",
+        ),
+        pytest.param(
+            "POST",
+            "/geometry",
+            lambda track_id: {"track_ids": [track_id]},
+            id="geometry",
+        ),
+    ],
+)
+async def test_user_cannot_access_other_users_track(
+    client, logged_in_with_track, method, path, body
 ):
-    map1_id = user1_with_map["map_id"]
-
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
-        login1 = await client.post(
-            "/api/v1/auth/login",
-            data={"username": "user1@example.com", "password": "password1"},
-        )
-        token1 = login1.json()["access_token"]
-
-        login2 = await client.post(
-            "/api/v1/auth/login",
-            data={"username": "user2@example.com", "password": "password2"},
-        )
-        token2 = login2.json()["access_token"]
-
-        upload = await client.post(
-            f"/api/v1/maps/{map1_id}/tracks",
-            files=[("files", ("track.gpx", sample_gpx_file, "application/gpx+xml"))],
-            headers={"Authorization": f"Bearer {token1}"},
-        )
-        track_id = upload.json()["track_ids"][0]
+    map1_id = logged_in_with_track["map1_id"]
+    track_id = logged_in_with_track["track_id"]
+
+    response = await client.request(
+        method,
+        f"/api/v1/maps/{map1_id}/tracks" + path.format(track_id=track_id),
+        json=body(track_id),
+        headers={"Authorization": f"Bearer {logged_in_with_track['token2']}"},
+    )
 
-        geometry_response = await client.post(
-            f"/api/v1/maps/{map1_id}/tracks/geometry",
-            json={"track_ids": [track_id]},
-            headers={"Authorization": f"Bearer {token2}"},
-        )
+    assert response.status_code == 404
 
-        assert geometry_response.status_code == 404
+    tracks = await client.get(
+        f"/api/v1/maps/{map1_id}/tracks",
+        headers={"Authorization": f"Bearer {logged_in_with_track['token1']}"},
+    )
+    assert [track["name"] for track in tracks.json()] == ["track"]
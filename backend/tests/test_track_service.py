@@ -1,18 +1,41 @@
+import dataclasses
+import uuid
 import pytest
 import pytest_asyncio
-from pathlib import Path
+from backend.models.track_model import Track as TrackModel
 from backend.services.track_service import TrackService
-from backend.services.gpx_parser import GPXParser
-from backend.services.storage_service import StorageService
 from backend.services.map_service import MapService
 from .conftest import create_test_user
 
 
-@pytest.fixture
-def track_service(test_gpx_dir):
-    storage = StorageService(test_gpx_dir)
-    parser = GPXParser()
-    return TrackService(storage, parser)
+pytestmark = pytest.mark.usefixtures("cache_parsed_gpx", "gpx_storage")
+
+
+@pytest.fixture(scope="module")
+def track_service(module_storage, gpx_parser):
+    return TrackService(module_storage, gpx_parser)
+
+
+@pytest.fixture(scope="module")
+def sample_track_values(parsed_sample_gpx):
+    """Column values of the cycling sample, copied once per module"""
+    return dataclasses.asdict(parsed_sample_gpx)
+
+
+async def insert_track(session, map_id: int, name: str, values: dict) -> TrackModel:
+    """Add a track row directly, skipping hashing, downsampling and storage."""
+    track = TrackModel(
+        user_id="test-user-id",
+        map_id=map_id,
+        hash=uuid.uuid4().hex,
+        name=name,
+        filename=f"{name}.gpx",
+        activity_type="Cycling",
+        **values,
+    )
+    session.add(track)
+    await session.flush()
+    return track
 
 
 @pytest_asyncio.fixture
@@ -20,26 +43,14 @@ async def test_map(test_db_session):
     await create_test_user(test_db_session, "test-user-id")
     map_service = MapService()
     m = await map_service.create_map("Test Map", "test-user-id", test_db_session)
-    await test_db_session.commit()
     return m
 
 
-@pytest.fixture
-def sample_gpx():
-    test_dir = Path(__file__).parent
-    gpx_path = (
-        test_dir / ".." / ".." / "sample-gpx-files" / "Cycling 2025-12-19T211415Z.gpx"
-    )
-    with open(gpx_path, "rb") as f:
-        return f.read()
-
-
 @pytest.mark.asyncio
-async def test_upload_track(track_service, sample_gpx, test_db_session, test_map):
+async def test_upload_track(track_service, tiny_gpx_file, test_db_session, test_map):
     result = await track_service.upload_track(
-        "test.gpx", sample_gpx, test_map.id, "test-user-id", test_db_session
+        "test.gpx", tiny_gpx_file, test_map.id, "test-user-id", test_db_session
     )
-    await test_db_session.commit()
 
     assert result.duplicate is False
     assert result.track.name == "test"
@@ -49,15 +60,14 @@ async def test_upload_track(track_service, sample_gpx, test_db_session, test_map
 
 @pytest.mark.asyncio
 async def test_duplicate_detection(
-    track_service, sample_gpx, test_db_session, test_map
+    track_service, tiny_gpx_file, test_db_session, test_map
 ):
     await track_service.upload_track(
-        "test.gpx", sample_gpx, test_map.id, "test-user-id", test_db_session
+        "test.gpx", tiny_gpx_file, test_map.id, "test-user-id", test_db_session
     )
-    await test_db_session.commit()
 
     result = await track_service.upload_track(
-        "test2.gpx", sample_gpx, test_map.id, "test-user-id", test_db_session
+        "test2.gpx", tiny_gpx_file, test_map.id, "test-user-id", test_db_session
     )
 
     assert result.duplicate is True
@@ -65,11 +75,10 @@ async def test_duplicate_detection(
 
 
 @pytest.mark.asyncio
-async def test_list_tracks(track_service, sample_gpx, test_db_session, test_map):
+async def test_list_tracks(track_service, tiny_gpx_file, test_db_session, test_map):
     await track_service.upload_track(
-        "track1.gpx", sample_gpx, test_map.id, "test-user-id", test_db_session
+        "track1.gpx", tiny_gpx_file, test_map.id, "test-user-id", test_db_session
     )
-    await test_db_session.commit()
 
     tracks = await track_service.list_tracks(
         test_map.id, "test-user-id", test_db_session
@@ -80,12 +89,13 @@ async def test_list_tracks(track_service, sample_gpx, test_db_session, test_map)
 
 
 @pytest.mark.asyncio
-async def test_get_track_geometry(track_service, sample_gpx, test_db_session, test_map):
+async def test_get_track_geometry(
+    track_service, sample_gpx_file, test_db_session, test_map
+):
     result = await track_service.upload_track(
-        "test.gpx", sample_gpx, test_map.id, "test-user-id", test_db_session
+        "test.gpx", sample_gpx_file, test_map.id, "test-user-id", test_db_session
     )
     track_id = result.track.id
-    await test_db_session.commit()
 
     geometry = await track_service.get_track_geometry(
         track_id, test_map.id, "test-user-id", test_db_session
@@ -94,29 +104,20 @@ async def test_get_track_geometry(track_service, sample_gpx, test_db_session, te
     assert geometry is not None
     assert geometry.track_id == track_id
     assert len(geometry.coordinates) > 0
-    assert isinstance(geometry.coordinates[0], tuple)
+    assert isinstance(geometry.coordinates[0], list)
+    assert len(geometry.coordinates[0]) == 2
 
 
 @pytest.mark.asyncio
-async def test_get_multiple_geometries(track_service, test_db_session, test_map):
-    test_dir = Path(__file__).parent
-    gpx1_path = (
-        test_dir / ".." / ".." / "sample-gpx-files" / "Cycling 2025-12-19T211415Z.gpx"
-    )
-    gpx2_path = test_dir / ".." / ".." / "sample-gpx-files" / "Walking 2031.gpx"
-
-    with open(gpx1_path, "rb") as f:
-        content1 = f.read()
-    with open(gpx2_path, "rb") as f:
-        content2 = f.read()
-
+async def test_get_multiple_geometries(
+    track_service, sample_gpx_file, walking_gpx_file, test_db_session, test_map
+):
     result1 = await track_service.upload_track(
-        "track1.gpx", content1, test_map.id, "test-user-id", test_db_session
+        "track1.gpx", sample_gpx_file, test_map.id, "test-user-id", test_db_session
     )
     result2 = await track_service.upload_track(
-        "track2.gpx", content2, test_map.id, "test-user-id", test_db_session
+        "track2.gpx", walking_gpx_file, test_map.id, "test-user-id", test_db_session
     )
-    await test_db_session.commit()
 
     track_ids = [result1.track.id, result2.track.id]
     geometries = await track_service.get_multiple_geometries(
@@ -126,24 +127,25 @@ async def test_get_multiple_geometries(track_service, test_db_session, test_map)
     assert len(geometries) == 2
     assert geometries[0].track_id == result1.track.id
     assert geometries[1].track_id == result2.track.id
+    for geometry in geometries:
+        assert geometry.segment_speeds is not None
+        assert len(geometry.segment_speeds) == len(geometry.coordinates) - 1
 
 
 @pytest.mark.asyncio
 async def test_update_track_visibility(
-    track_service, sample_gpx, test_db_session, test_map
+    track_service, sample_track_values, test_db_session, test_map
 ):
-    result = await track_service.upload_track(
-        "test.gpx", sample_gpx, test_map.id, "test-user-id", test_db_session
+    track = await insert_track(
+        test_db_session, test_map.id, "test", sample_track_values
     )
-    track_id = result.track.id
-    await test_db_session.commit()
+    track_id = track.id
 
-    assert result.track.visible is True
+    assert track.visible is True
 
     updated = await track_service.update_track(
         track_id, {"visible": False}, test_map.id, "test-user-id", test_db_session
     )
-    await test_db_session.commit()
 
     assert updated is not None
     assert updated.visible is False
@@ -160,22 +162,20 @@ async def test_update_nonexistent_track(track_service, test_db_session, test_map
 
 @pytest.mark.asyncio
 async def test_delete_single_track(
-    track_service, sample_gpx, test_db_session, test_gpx_dir, test_map
+    track_service, sample_gpx_file, test_db_session, test_map
 ):
     result = await track_service.upload_track(
-        "test.gpx", sample_gpx, test_map.id, "test-user-id", test_db_session
+        "test.gpx", sample_gpx_file, test_map.id, "test-user-id", test_db_session
     )
     track_id = result.track.id
     gpx_hash = result.track.hash
-    await test_db_session.commit()
 
-    gpx_file_path = test_gpx_dir / f"test-user-id_{gpx_hash}.gpx"
+    gpx_file_path = track_service.storage.storage_path / f"test-user-id_{gpx_hash}.gpx"
     assert gpx_file_path.exists()
 
     delete_result = await track_service.delete_tracks(
         [track_id], test_map.id, "test-user-id", test_db_session
     )
-    await test_db_session.commit()
 
     for hash_to_delete in delete_result.hashes_to_delete:
         track_service.storage.delete_gpx("test-user-id", hash_to_delete)
@@ -193,45 +193,34 @@ async def test_delete_single_track(
 
 
 @pytest.mark.asyncio
-async def test_delete_multiple_tracks(track_service, test_db_session, test_map):
-    test_dir = Path(__file__).parent
-    gpx1_path = (
-        test_dir / ".." / ".." / "sample-gpx-files" / "Cycling 2025-12-19T211415Z.gpx"
-    )
-    gpx2_path = test_dir / ".." / ".." / "sample-gpx-files" / "Walking 2031.gpx"
-
-    with open(gpx1_path, "rb") as f:
-        content1 = f.read()
-    with open(gpx2_path, "rb") as f:
-        content2 = f.read()
-
-    result1 = await track_service.upload_track(
-        "track1.gpx", content1, test_map.id, "test-user-id", test_db_session
+async def test_delete_multiple_tracks(
+    track_service, sample_track_values, test_db_session, test_map
+):
+    track1 = await insert_track(
+        test_db_session, test_map.id, "track1", sample_track_values
     )
-    result2 = await track_service.upload_track(
-        "track2.gpx", content2, test_map.id, "test-user-id", test_db_session
+    track2 = await insert_track(
+        test_db_session, test_map.id, "track2", sample_track_values
     )
-    await test_db_session.commit()
 
-    track_ids = [result1.track.id, result2.track.id]
+    track_ids = [track1.id, track2.id]
 
     delete_result = await track_service.delete_tracks(
         track_ids, test_map.id, "test-user-id", test_db_session
     )
-    await test_db_session.commit()
 
     assert delete_result.deleted == 2
     assert len(delete_result.hashes_to_delete) == 2
 
     assert (
         await track_service.get_track_metadata(
-            result1.track.id, test_map.id, "test-user-id", test_db_session
+            track1.id, test_map.id, "test-user-id", test_db_session
         )
         is None
     )
     assert (
         await track_service.get_track_metadata(
-            result2.track.id, test_map.id, "test-user-id", test_db_session
+            track2.id, test_map.id, "test-user-id", test_db_session
         )
         is None
     )
@@ -249,18 +238,16 @@ async def test_delete_nonexistent_track(track_service, test_db_session, test_map
 
 @pytest.mark.asyncio
 async def test_delete_with_mixed_ids(
-    track_service, sample_gpx, test_db_session, test_map
+    track_service, sample_track_values, test_db_session, test_map
 ):
-    result1 = await track_service.upload_track(
-        "track1.gpx", sample_gpx, test_map.id, "test-user-id", test_db_session
+    track = await insert_track(
+        test_db_session, test_map.id, "track1", sample_track_values
     )
-    track_id = result1.track.id
-    await test_db_session.commit()
+    track_id = track.id
 
     delete_result = await track_service.delete_tracks(
         [9999, track_id, 8888], test_map.id, "test-user-id", test_db_session
     )
-    await test_db_session.commit()
 
     assert delete_result.deleted == 1
     assert len(delete_result.hashes_to_delete) == 1
@@ -275,28 +262,25 @@ async def test_delete_with_mixed_ids(
 
 @pytest.mark.asyncio
 async def test_delete_preserves_gpx_when_shared_across_maps(
-    track_service, sample_gpx, test_db_session, test_map
+    track_service, sample_gpx_file, test_db_session, test_map
 ):
     map_service = MapService()
     second_map = await map_service.create_map(
         "Second Map", "test-user-id", test_db_session
     )
-    await test_db_session.commit()
 
     result1 = await track_service.upload_track(
-        "test.gpx", sample_gpx, test_map.id, "test-user-id", test_db_session
+        "test.gpx", sample_gpx_file, test_map.id, "test-user-id", test_db_session
     )
     result2 = await track_service.upload_track(
-        "test.gpx", sample_gpx, second_map.id, "test-user-id", test_db_session
+        "test.gpx", sample_gpx_file, second_map.id, "test-user-id", test_db_session
     )
-    await test_db_session.commit()
 
     assert result1.track.hash == result2.track.hash
 
     delete_result = await track_service.delete_tracks(
         [result1.track.id], test_map.id, "test-user-id", test_db_session
     )
-    await test_db_session.commit()
 
     assert delete_result.deleted == 1
     assert len(delete_result.hashes_to_delete) == 0
@@ -308,64 +292,30 @@ async def test_delete_preserves_gpx_when_shared_across_maps(
 
 
 @pytest.mark.asyncio
-async def test_upload_infers_activity_type_from_filename(
-    track_service, sample_gpx, test_db_session, test_map
+async def test_upload_cycling_filename(
+    track_service, tiny_gpx_file, test_db_session, test_map
 ):
-    result = await track_service.upload_track(
-        "Walking 2031.gpx", sample_gpx, test_map.id, "test-user-id", test_db_session
-    )
-    await test_db_session.commit()
-
-    assert result.track.activity_type == "Walking"
-
-
-@pytest.mark.asyncio
-async def test_upload_cycling_filename(track_service, test_db_session, test_map):
-    test_dir = Path(__file__).parent
-    gpx_path = (
-        test_dir / ".." / ".." / "sample-gpx-files" / "Cycling 2025-12-19T211415Z.gpx"
-    )
-    with open(gpx_path, "rb") as f:
-        content = f.read()
-
+    # The filename rules themselves are covered in test_gpx_parser
     result = await track_service.upload_track(
         "Cycling 2025-12-19T211415Z.gpx",
-        content,
+        tiny_gpx_file,
         test_map.id,
         "test-user-id",
         test_db_session,
     )
-    await test_db_session.commit()
 
     assert result.track.activity_type == "Cycling"
     assert result.track.filename == "Cycling 2025-12-19T211415Z.gpx"
 
 
-@pytest.mark.asyncio
-async def test_upload_unknown_filename(
-    track_service, sample_gpx, test_db_session, test_map
-):
-    result = await track_service.upload_track(
-        "route_2025-03-01_5.31pm.gpx",
-        sample_gpx,
-        test_map.id,
-        "test-user-id",
-        test_db_session,
-    )
-    await test_db_session.commit()
-
-    assert result.track.activity_type == "Unknown"
-
-
 @pytest.mark.asyncio
 async def test_geometry_includes_segment_speeds(
-    track_service, sample_gpx, test_db_session, test_map
+    track_service, sample_gpx_file, test_db_session, test_map
 ):
     result = await track_service.upload_track(
-        "test.gpx", sample_gpx, test_map.id, "test-user-id", test_db_session
+        "test.gpx", sample_gpx_file, test_map.id, "test-user-id", test_db_session
     )
     track_id = result.track.id
-    await test_db_session.commit()
 
     geometry = await track_service.get_track_geometry(
         track_id, test_map.id, "test-user-id", test_db_session
@@ -377,61 +327,15 @@ async def test_geometry_includes_segment_speeds(
     assert all(speed >= 0 for speed in geometry.segment_speeds)
 
 
-@pytest.mark.asyncio
-async def test_multiple_geometries_include_segment_speeds(
-    track_service, test_db_session, test_map
-):
-    test_dir = Path(__file__).parent
-    gpx1_path = (
-        test_dir / ".." / ".." / "sample-gpx-files" / "Cycling 2025-12-19T211415Z.gpx"
-    )
-    gpx2_path = test_dir / ".." / ".." / "sample-gpx-files" / "Walking 2031.gpx"
-
-    with open(gpx1_path, "rb") as f:
-        content1 = f.read()
-    with open(gpx2_path, "rb") as f:
-        content2 = f.read()
-
-    result1 = await track_service.upload_track(
-        "track1.gpx", content1, test_map.id, "test-user-id", test_db_session
-    )
-    result2 = await track_service.upload_track(
-        "track2.gpx", content2, test_map.id, "test-user-id", test_db_session
-    )
-    await test_db_session.commit()
-
-    track_ids = [result1.track.id, result2.track.id]
-    geometries = await track_service.get_multiple_geometries(
-        track_ids, test_map.id, "test-user-id", test_db_session
-    )
-
-    for geometry in geometries:
-        assert geometry.segment_speeds is not None
-        assert len(geometry.segment_speeds) == len(geometry.coordinates) - 1
-
-
 @pytest.mark.asyncio
 async def test_coordinates_stored_at_50_percent_resolution(
-    track_service, test_db_session, test_map
+    track_service, sample_gpx_file, parsed_sample_gpx, test_db_session, test_map
 ):
-    from ..services.gpx_parser import GPXParser
-
-    test_dir = Path(__file__).parent
-    gpx_path = (
-        test_dir / ".." / ".." / "sample-gpx-files" / "Cycling 2025-12-19T211415Z.gpx"
-    )
-
-    with open(gpx_path, "rb") as f:
-        content = f.read()
-
-    parser = GPXParser()
-    gpx_data = parser.parse(content)
-    original_count = len(gpx_data.coordinates)
+    original_count = len(parsed_sample_gpx.coordinates)
 
     result = await track_service.upload_track(
-        "test.gpx", content, test_map.id, "test-user-id", test_db_session
+        "test.gpx", sample_gpx_file, test_map.id, "test-user-id", test_db_session
     )
-    await test_db_session.commit()
 
     geometry = await track_service.get_track_geometry(
         result.track.id, test_map.id, "test-user-id", test_db_session
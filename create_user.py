@@ -1,6 +1,7 @@
 import asyncio
 import uuid
 import sys
+from typing import Iterable
 from passlib.context import CryptContext
 
 sys.path.insert(0, ".")
@@ -12,41 +13,75 @@ from backend.services.map_service import MapService
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
-async def create_user(email: str, password: str):
-    hashed_password = pwd_context.hash(password)
-
-    user = User(
-        id=str(uuid.uuid4()),
-        email=email.lower(),
-        hashed_password=hashed_password,
-        is_active=True,
-        is_verified=True,
-        is_superuser=False,
+async def create_users(credentials: list[tuple[str, str]]) -> None:
+    """Create each user with a default map, all in one session and commit."""
+    # bcrypt releases the GIL, so hash every password concurrently in threads
+    loop = asyncio.get_running_loop()
+    hashed_passwords = await asyncio.gather(
+        *(
+            loop.run_in_executor(None, pwd_context.hash, password)
+            for _, password in credentials
+        )
     )
+    created = []
 
     async with async_session_maker() as session:
-        session.add(user)
-        await session.flush()
-
         map_service = MapService()
-        new_map = await map_service.create_map(
-            name="My Map",
-            user_id=str(user.id),
-            session=session,
-        )
+
+        for (email, _), hashed_password in zip(credentials, hashed_passwords):
+            user = User(
+                id=str(uuid.uuid4()),
+                email=email.lower(),
+                hashed_password=hashed_password,
+                is_active=True,
+                is_verified=True,
+                is_superuser=False,
+            )
+            session.add(user)
+            await session.flush()
+
+            new_map = await map_service.create_map(
+                name="My Map",
+                user_id=str(user.id),
+                session=session,
+            )
+            created.append((email, user.id, new_map.id))
 
         await session.commit()
+
+    for email, user_id, map_id in created:
         print(f"✓ Created user: {email}")
-        print(f"  User ID: {user.id}")
-        print(f"  Map ID: {new_map.id}")
+        print(f"  User ID: {user_id}")
+        print(f"  Map ID: {map_id}")
+
+
+def read_credentials(lines: Iterable[str]) -> list[tuple[str, str]]:
+    credentials = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        email, sep, password = line.partition(":")
+        if not sep or not email or not password:
+            raise ValueError(f"Expected email:password, got {line!r}")
+        credentials.append((email, password))
+    return credentials
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
+    if len(sys.argv) == 2 and sys.argv[1] == "-":
+        try:
+            credentials = read_credentials(sys.stdin)
+        except ValueError as e:
+            print(e)
+            sys.exit(1)
+    elif len(sys.argv) == 3:
+        credentials = [(sys.argv[1], sys.argv[2])]
+    else:
         print("Usage: python create_user.py <email> <password>")
+        print(
+            "       python create_user.py - < users.txt  (one email:password per line)"
+        )
         sys.exit(1)
 
-    email = sys.argv[1]
-    password = sys.argv[2]
-
-    asyncio.run(create_user(email, password))
+    asyncio.run(create_users(credentials))
@@ -9,7 +9,7 @@ echo "🚀 Deploying Color The Map to production server..."
 # Run tests
 echo "🧪 Running backend tests..."
 source venv/bin/activate
-pytest backend/tests/ -v --tb=short || { echo "❌ Backend tests failed!"; exit 1; }
+pytest backend/tests/ -n auto --dist=loadfile -v --tb=short || { echo "❌ Backend tests failed!"; exit 1; }
 
 echo "🧪 Running frontend tests..."
 cd frontend